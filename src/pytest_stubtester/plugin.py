@@ -8,12 +8,12 @@ from functools import partial
 from pathlib import Path
 from typing import NamedTuple, TypeIs
 
-import pyochain as pc
 import pytest
 
 type IsDef = ast.FunctionDef | ast.ClassDef
 COMMAND = "--stubs"
 MARKDOWN_BLOCK = re.compile(r"```python\n(.*?)\n```")
+PARSER = doctest.DocTestParser()
 
 
 class Parsed(NamedTuple):
@@ -30,7 +30,7 @@ class Parsed(NamedTuple):
         """Convert the parsed information to a doctest."""
         return (
             self.name,
-            doctest.DocTestParser().get_doctest(
+            PARSER.get_doctest(
                 _extract_markdown_code_blocks(self.docstring),
                 globs={},
                 name=self.name,
@@ -50,18 +50,14 @@ class PyiModule(pytest.Module):
             pytest.Item: pytest.Function items for each doctest.
 
         """
-        return (
-            _extract_doctests_from_ast(self.path)
-            .map(lambda parsed: parsed.to_doctest(self.path))
-            .filter_star(lambda _, test: bool(test.examples))
-            .map_star(
-                lambda name, test: pytest.Function.from_parent(  # type: ignore[arg-type]
+        for parsed in _extract_doctests_from_ast(self.path):
+            name, test = parsed.to_doctest(self.path)
+            if test.examples:
+                yield pytest.Function.from_parent(  # type: ignore[arg-type]
                     name=name,
                     parent=self,
                     callobj=partial(_run_doctest, test),
                 )
-            )
-        )
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -103,68 +99,60 @@ def pytest_collect_file(
     return PyiModule.from_parent(parent=parent, path=file_path)  # type: ignore[arg-type]
 
 
-def _extract_doctests_from_ast(file_path: Path) -> pc.Iter[Parsed]:
-    tree = _get_tree(file_path)
-    if tree.is_err():
-        return pc.Iter[Parsed].new()
+def _extract_doctests_from_ast(file_path: Path) -> Iterator[Parsed]:
+    module = _get_tree(file_path)
+    if module is None:
+        return
 
-    module_docstring = ast.get_docstring(tree.unwrap())
-    module_tests = (
-        pc.Iter.once(Parsed(file_path.stem, module_docstring, 1))
-        if module_docstring and ">>>" in module_docstring
-        else pc.Iter[Parsed].new()
-    )
+    module_docstring = ast.get_docstring(module)
+    if module_docstring and ">>>" in module_docstring:
+        yield Parsed(file_path.stem, module_docstring, 1)
 
-    return module_tests.chain(
-        pc.Iter(tree.unwrap().body)
-        .filter(_is_def)
-        .flat_map(lambda node: _recurse_extract(node))
-        .map_star(Parsed)
-    )
+    for node in module.body:
+        if _is_def(node):
+            yield from _walk_defs(node)
 
 
-def _get_tree(file_path: Path) -> pc.Result[ast.Module, None]:
+def _get_tree(file_path: Path) -> ast.Module | None:
+    source = file_path.read_bytes()
+    if b">>>" not in source:
+        return None
     try:
-        return pc.Ok(ast.parse(file_path.read_text(), filename=str(file_path)))
+        return ast.parse(source, filename=str(file_path))
     except SyntaxError:
-        return pc.Err(None)
+        return None
 
 
 def _extract_markdown_code_blocks(docstring: str) -> str:
-    return (
-        pc.Iter(MARKDOWN_BLOCK.findall(docstring))
-        .then_some()
-        .map(lambda m: m.join("\n"))
-        .unwrap_or(docstring)
-    )
-
-
-def _recurse_extract(node: IsDef, prefix: str = "") -> Iterator[tuple[str, str, int]]:
-    docstring = ast.get_docstring(node)
-    full_name = f"{prefix}{node.name}" if prefix else node.name
-
-    if docstring and ">>>" in docstring:
-        yield (full_name, docstring, node.lineno)
-    if isinstance(node, ast.ClassDef):
-        yield from (
-            pc.Iter(node.body)
-            .filter(_is_def)
-            .flat_map(lambda n: _recurse_extract(n, f"{full_name}."))
-        )
+    blocks = MARKDOWN_BLOCK.findall(docstring)
+    return "\n".join(blocks) if blocks else docstring
+
+
+def _walk_defs(root: IsDef) -> Iterator[Parsed]:
+    stack: list[tuple[IsDef, str]] = [(root, "")]
+    while stack:
+        node, prefix = stack.pop()
+        full_name = f"{prefix}{node.name}"
+        docstring = ast.get_docstring(node)
+        if docstring and ">>>" in docstring:
+            yield Parsed(full_name, docstring, node.lineno)
+        if isinstance(node, ast.ClassDef):
+            stack.extend(
+                (child, f"{full_name}.")
+                for child in reversed(node.body)
+                if _is_def(child)
+            )
 
 
 def _run_doctest(dtest: doctest.DocTest) -> None:
-    runner = doctest.DocTestRunner()
-    runner.run(dtest)
-    if runner.failures:
-        failure_msgs = (
-            pc.Iter(dtest.examples)
-            .enumerate()
-            .filter_star(lambda _, ex: ex.exc_msg is not None)
-            .map_star(lambda _, ex: f"Line {ex.lineno}: {ex.source.strip()}")
-            .join("\n")
+    result = doctest.DocTestRunner(verbose=False).run(dtest)
+    if result.failed:
+        failure_msgs = "\n".join(
+            f"Line {ex.lineno}: {ex.source.strip()}"
+            for ex in dtest.examples
+            if ex.exc_msg is not None
         )
-        pytest.fail(f"Doctest failed: {runner.failures} failures\n{failure_msgs}")
+        pytest.fail(f"Doctest failed: {result.failed} failures\n{failure_msgs}")
 
 
 def _is_def(n: object) -> TypeIs[IsDef]:
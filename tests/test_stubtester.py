@@ -1,8 +1,8 @@
 """Tests for the pytest-stubtester plugin."""
 
+import os
 from pathlib import Path
 
-import pyochain as pc
 import pytest
 
 import pytest_stubtester as pst
@@ -128,6 +128,141 @@ def sub(a: int, b: int) -> int:
     result.stdout.fnmatch_lines(["*multi.pyi::sub*PASSED*"])
 
 
+def test_verbose_flag_does_not_trace_examples(pytester: pytest.Pytester) -> None:
+    """Pytest's -v should not switch doctest into per-example tracing."""
+    pytester.makefile(
+        ".pyi",
+        quiet="""
+def add(a: int, b: int) -> int:
+    \"\"\"Add.
+
+    >>> 1 + 1
+    3
+    \"\"\"
+""",
+    )
+
+    result = pytester.runpytest_subprocess(pst.COMMAND, "-v")
+    result.assert_outcomes(failed=1)
+    result.stdout.no_fnmatch_line("Trying:")
+
+
+def test_nested_class_doctests(pytester: pytest.Pytester) -> None:
+    """Methods and nested classes should be collected with dotted names."""
+    pytester.makefile(
+        ".pyi",
+        nested="""
+class Outer:
+    \"\"\"Outer.
+
+    >>> 1
+    1
+    \"\"\"
+
+    def method(self) -> None:
+        \"\"\"Method.
+
+        >>> 2
+        2
+        \"\"\"
+
+    class Inner:
+        def deep(self) -> None:
+            \"\"\"Deep.
+
+            >>> 3
+            3
+            \"\"\"
+
+def after() -> None:
+    \"\"\"After.
+
+    >>> 4
+    4
+    \"\"\"
+""",
+    )
+
+    result = pytester.runpytest(pst.COMMAND, "-v")
+    assert result.ret == 0
+    result.stdout.fnmatch_lines(
+        [
+            "*nested.pyi::Outer PASSED*",
+            "*nested.pyi::Outer::method PASSED*",
+            "*nested.pyi::Outer::Inner::deep PASSED*",
+            "*nested.pyi::after PASSED*",
+        ]
+    )
+
+
+def test_failure_does_not_leak_into_next_doctest(pytester: pytest.Pytester) -> None:
+    """A failing doctest should not mark later doctests as failed."""
+    pytester.makefile(
+        ".pyi",
+        mixed="""
+def bad() -> None:
+    \"\"\"Fail.
+
+    >>> 1 + 1
+    3
+    \"\"\"
+
+def good() -> None:
+    \"\"\"Pass.
+
+    >>> 1 + 1
+    2
+    \"\"\"
+""",
+    )
+
+    result = pytester.runpytest(pst.COMMAND, "-v")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines(["*mixed.pyi::good*PASSED*"])
+
+
+def test_modified_file_is_reparsed(pytester: pytest.Pytester) -> None:
+    """Editing a .pyi file between runs should invalidate the parse cache."""
+    path = pytester.makefile(
+        ".pyi",
+        edited="""
+def add(a: int, b: int) -> int:
+    \"\"\"Add.
+
+    >>> 1 + 1
+    2
+    \"\"\"
+""",
+    )
+    pytester.runpytest(pst.COMMAND).assert_outcomes(passed=1)
+
+    path.write_text(path.read_text().replace("1 + 1", "1 + 10"))
+    pytester.runpytest(pst.COMMAND).assert_outcomes(failed=1)
+
+
+def test_same_size_edit_within_same_mtime_is_reparsed(
+    pytester: pytest.Pytester,
+) -> None:
+    """An edit keeping both size and mtime (coarse timestamps) should be seen."""
+    path = pytester.makefile(
+        ".pyi",
+        same_tick="""
+def add(a: int, b: int) -> int:
+    \"\"\"Add.
+
+    >>> 1 + 1
+    2
+    \"\"\"
+""",
+    )
+    stat = path.stat()
+    pytester.runpytest(pst.COMMAND).assert_outcomes(passed=1)
+
+    path.write_text(path.read_text().replace("1 + 1", "1 + 2"))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    pytester.runpytest(pst.COMMAND).assert_outcomes(failed=1)
+
+
 def test_non_pyi_files_ignored(pytester: pytest.Pytester) -> None:
     """Non-.pyi files should be ignored even with plugin enabled."""
     pytester.makefile(
@@ -170,14 +305,48 @@ def function_with_docstring_no_tests(x: int) -> int:
     assert result.ret == no_tests_collected
 
 
+def test_pyi_file_with_syntax_error(pytester: pytest.Pytester) -> None:
+    """.pyi file that cannot be parsed should be skipped without errors."""
+    pytester.makefile(
+        ".pyi",
+        broken="""
+def broken(x: int -> int:
+    \"\"\"Broken signature.
+
+    >>> 1 + 1
+    2
+    \"\"\"
+""",
+    )
+
+    result = pytester.runpytest(pst.COMMAND, "-v", "--collect-only")
+    no_tests_collected = 5
+    assert result.ret == no_tests_collected
+
+
+def test_pyi_file_with_coding_cookie(pytester: pytest.Pytester) -> None:
+    """.pyi file encoding should follow its PEP 263 coding declaration."""
+    path = pytester.path.joinpath("latin.pyi")
+    path.write_bytes(
+        """# -*- coding: latin-1 -*-
+def accent() -> str:
+    \"\"\"Return an accented letter.
+
+    >>> len("\u00e9")
+    1
+    \"\"\"
+""".encode("latin-1")
+    )
+
+    pytester.runpytest(pst.COMMAND).assert_outcomes(passed=1)
+
+
 def test_real_success_examples() -> None:
     """Real example files in tests/examples/success should exist."""
     success_dir = Path("tests", "examples", "success")
     assert success_dir.exists()
 
-    assert pc.Iter(success_dir.glob("*.pyi")).length() > 0, (
-        "Should have .pyi test files in success/"
-    )
+    assert any(success_dir.glob("*.pyi")), "Should have .pyi test files in success/"
 
 
 def test_real_failure_examples() -> None:
@@ -185,6 +354,4 @@ def test_real_failure_examples() -> None:
     failures_dir = Path("tests", "examples", "failures")
     assert failures_dir.exists()
 
-    assert pc.Iter(failures_dir.glob("*.pyi")).length() > 0, (
-        "Should have .pyi test files in failures/"
-    )
+    assert any(failures_dir.glob("*.pyi")), "Should have .pyi test files in failures/"